@@ -12,25 +12,36 @@ class frozendict(dict):
      - With no constraint that the values are hashable, only the keys.
      - The order of the underlying dict's keys is ignored when hashing.
      - Inherits from dict only, and thus not explicitly particpate in any metaclass.
+     - The hash is computed once, on first use, and then cached.
     """
 
+    __slots__ = ("_hash",)
+
     def __hash__(self) -> int:
-        return hash(frozenset(self.keys()))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.keys()))  # pylint: disable=attribute-defined-outside-init
+            return self._hash
 
-    def __setitem__(self, *args, **kwargs):
+    def _immutable(self, *args, **kwargs):
         raise NotImplementedError
 
+    # Every method that would modify the dict in place; the cached hash depends on its keys.
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+# Python 3.10 introduced int.bit_count()
+_bit_count = getattr(int, "bit_count", None) or (lambda i: bin(i).count("1"))
+
 
 def bit_count(i: int) -> int:
     """ Count the set bits in an integer i
 
-    Note: Python 3.10 introduced int.bit_count(); replace when it's released.
+    Older versions of Python count the ones in bin(i), which beats a loop over each bit.
     """
-    count = 0
-    while i != 0:
-        count += i & 0x1
-        i >>= 1
-    return count
+    return _bit_count(i)
 
 
 def mask(lsb: int, length: int) -> int:
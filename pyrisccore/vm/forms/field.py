@@ -1,11 +1,14 @@
 """ Slices of an instruction word that compose a distinct value
+
+The constraints on Field and Value objects are only checked when __debug__ is true; like assert
+statements, they're skipped by "python -O".
 """
 
 from dataclasses import dataclass, field
 from typing import Optional, Tuple
 
 from pyrisccore import PyrisccoreAssertion
-from pyrisccore.misc import bit_count, mask
+from pyrisccore.misc import mask
 from pyrisccore.vm.forms.slice import Slice
 
 
@@ -24,13 +27,26 @@ class Field:
     # For example, see the "imm" field of the J-Type instruction format.
     destination: Optional[Slice] = None
 
+    # The bit-mapping, flattened so get() and set() are plain arithmetic (see __post_init__).
+    _source_mask: int = field(init=False, repr=False, hash=False, compare=False)
+    _source_inverse: int = field(init=False, repr=False, hash=False, compare=False)
+    _source_start: int = field(init=False, repr=False, hash=False, compare=False)
+    _destination_start: int = field(init=False, repr=False, hash=False, compare=False)
+
     def __post_init__(self):
 
         # Enforce constraints on the destination Slice
-        if self.destination is not None:
+        if __debug__ and self.destination is not None:
             if self.source.length != self.destination.length:
                 raise PyrisccoreAssertion("A Field's source and destination slices must be the same length")
 
+        object.__setattr__(self, "_source_mask", self.source.mask)
+        object.__setattr__(self, "_source_inverse", ~self.source.mask)
+        object.__setattr__(self, "_source_start", self.source.start)
+
+        # Without a destination, the value is at bit 0.
+        object.__setattr__(self, "_destination_start", 0 if self.destination is None else self.destination.start)
+
     @property
     def length(self):
         return self.source.length
@@ -38,26 +54,17 @@ class Field:
     def get(self, source: int) -> int:
         """ Get bits from an integer "source" according to this Field's bit-mapping
         """
-        value = self.source.get(source)
-
-        if self.destination is None:
-            return value
-
-        return self.destination.set(value, 0)
+        return (source & self._source_mask) >> self._source_start << self._destination_start
 
     def set(self, value: int, destination: int = 0) -> int:
         """ Set the bits in an integer "destination" to a "value" according to this Field's bit-mapping
         """
-        if self.destination is not None:
-            value = self.destination.get(value)
-
-        return self.source.set(value, destination)
+        # Bits of the value outside of the destination slice land outside of the source mask.
+        value = value >> self._destination_start << self._source_start & self._source_mask
+        return (destination & self._source_inverse) | value
 
 
-@dataclass(
-    frozen=False,       # <- __post_init__() will fail if this is True.
-    unsafe_hash=True    # <- This object is used as though it's actually read-only.
-)
+@dataclass(frozen=True)
 class Value:
     """ One or more slices of an instruction word that make up a single value
     """
@@ -70,13 +77,15 @@ class Value:
 
     def __post_init__(self):
 
+        # The object is frozen, so attributes are computed into locals and then set below.
+
         # Constraint: This object works with one or more Field objects
-        if not self.fields:
+        if __debug__ and not self.fields:
             raise PyrisccoreAssertion("One or more Field objects required")
 
         # Cast self.fields to a tuple if it's a list or another sequence.
         if not isinstance(self.fields, tuple):
-            self.fields = tuple(self.fields)
+            object.__setattr__(self, "fields", tuple(self.fields))
 
         # Constraint:
         #
@@ -87,37 +96,36 @@ class Value:
         #     bits in the destination. This is to prevent bits in the source word
         #     from overwriting already-set bits in the destination.
         #
-        if len(self.fields) > 1:
+        if __debug__ and len(self.fields) > 1:
             for f in self.fields:
                 if f.destination is None:
                     raise PyrisccoreAssertion(f"Field is required to have a destination slice for '{self.name}': {f}")
 
         # Compute the complete source and destination masks for this value.
         # Also check that Fields do not overlap in source or destination.
-        self.source_mask = 0
-        self.destination_mask = 0
+        source_mask = 0
+        destination_mask = 0
 
         # A source->destination mapping isn't required for a single field.
         if len(self.fields) == 1:
-            self.source_mask = self.fields[0].source.mask
+            source_mask = self.fields[0].source.mask
             if self.fields[0].destination is None:
-                self.destination_mask = mask(0, self.fields[0].source.length)
+                destination_mask = mask(0, self.fields[0].source.length)
             else:
-                self.destination_mask = self.fields[0].destination.mask
+                destination_mask = self.fields[0].destination.mask
 
         # ... and is essential for multiple fields.
         else:
-            source_mask_bit_count = 0
-            destination_mask_bits_count = 0
             for f in self.fields:
-                self.source_mask |= f.source.mask
-                self.destination_mask |= f.destination.mask
-                if bit_count(self.source_mask) == source_mask_bit_count:
+                if __debug__ and f.source.mask & source_mask:
                     raise PyrisccoreAssertion(f"Field has overlapping source bits: {f}")
-                if bit_count(self.destination_mask) == destination_mask_bits_count:
+                if __debug__ and f.destination.mask & destination_mask:
                     raise PyrisccoreAssertion(f"Field has overlapping destination bits: {f}")
-                source_mask_bit_count = bit_count(self.source_mask)
-                destination_mask_bits_count = bit_count(self.destination_mask)
+                source_mask |= f.source.mask
+                destination_mask |= f.destination.mask
+
+        object.__setattr__(self, "source_mask", source_mask)
+        object.__setattr__(self, "destination_mask", destination_mask)
 
     def get(self, source: int) -> int:
         """ Get bits from an integer "source" according to this Value's bit-mappings
@@ -130,8 +138,10 @@ class Value:
     def set(self, value: int, destination: int) -> int:
         """ Set the bits in an integer "destination" to a "value" according to this Value's bit-mappings
         """
+        # Clear every bit of the value in the destination once, then OR in each field's bits.
+        destination &= ~self.source_mask
         for f in self.fields:
-            destination |= f.set(value, destination)
+            destination |= f.set(value)
         return destination
 
 
@@ -1,19 +1,116 @@
 """ An instruction "format" is a uniquely named composition of fields
 """
 
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from keyword import iskeyword
+from typing import Callable, Dict, List, Tuple
 
-from pyrisccore.vm.forms.field import Field
+from pyrisccore import PyrisccoreAssertion
+from pyrisccore.vm.forms.field import Field, Value
+
+
+def _shift(expression: str, amount: int) -> str:
+    """ Return Python source that shifts an expression left by an amount (right if negative)
+    """
+    if amount > 0:
+        return f"({expression} << {amount})"
+    if amount < 0:
+        return f"({expression} >> {-amount})"
+    return expression
 
 
 @dataclass
 class Format:
     """ An instruction format
+
+    Decoding and encoding are specialized for each format when it's created: the masks and shifts
+    of every field are folded into the source of a function that's compiled once, so that reading
+    or writing a word doesn't loop over the fields or look up their attributes.
     """
 
     name: str  # e.g. J
     fields: Tuple[Field, ...]
 
+    # Fields with the same name compose one Value, e.g. the four slices of "imm" in the J-Type.
+    values: Dict[str, Value] = field(init=False, repr=False, compare=False)
+
+    # A compiled function per value that gets it from a word, e.g. getters["rd"](word)
+    getters: Dict[str, Callable[[int], int]] = field(init=False, repr=False, compare=False)
+
+    _decode: Callable[[int], Dict[str, int]] = field(init=False, repr=False, compare=False)
+    _encode: Callable[..., int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+
+        fields_by_name: Dict[str, List[Field]] = {}
+        for f in self.fields:
+            if f.name is None or not f.name.isidentifier() or iskeyword(f.name):
+                raise PyrisccoreAssertion(f"Field in format '{self.name}' must be named by an identifier: {f}")
+            fields_by_name.setdefault(f.name, []).append(f)
+        self.values = {name: Value(fields, name) for name, fields in fields_by_name.items()}
+
+        # e.g. "imm": ((word & 0x80000000) >> 11) | ((word & 0x7fe00000) >> 20) | ...
+        expressions: Dict[str, str] = {}
+        for name, fields in fields_by_name.items():
+            terms = []
+            for f in fields:
+                destination_start = 0 if f.destination is None else f.destination.start
+                terms.append(_shift(f"(word & {f.source.mask:#x})", destination_start - f.source.start))
+            expressions[name] = " | ".join(terms)
+
+        source = "".join(
+            f"def get_{name}(word):\n"
+            f"    return {expression}\n"
+            for name, expression in expressions.items()
+        )
+        source += (
+            f"def decode(word):\n"
+            f"    return {{{', '.join(f'{name!r}: {expression}' for name, expression in expressions.items())}}}\n"
+        )
+
+        namespace: Dict[str, Callable] = {}
+        exec(source, namespace)  # pylint: disable=exec-used
+        self.getters = {name: namespace[f"get_{name}"] for name in expressions}
+        self._decode = namespace["decode"]
+        self._encode = self.compile_encoder()
+
+    def compile_encoder(self, fixed_mask: int = 0, fixed_bits: int = 0) -> Callable[..., int]:
+        """ Compile a function that composes an instruction word from the values of named fields
+
+        The bits in "fixed_mask" are always those of "fixed_bits"; fields (or the parts of fields)
+        in those bits are left out of the function. Its keyword arguments are the names of the
+        remaining fields, each zero by default.
+        """
+        names: List[str] = []
+
+        # e.g. ((imm << 11) & 0x80000000) | ((imm << 20) & 0x7fe00000) | ...
+        encoders = [f"{fixed_bits & fixed_mask:#x}"]
+        for f in self.fields:
+            bits = f.source.mask & ~fixed_mask
+            if not bits:
+                continue
+            if f.name not in names:
+                names.append(f.name)
+            destination_start = 0 if f.destination is None else f.destination.start
+            encoders.append(f"({_shift(f.name, f.source.start - destination_start)} & {bits:#x})")
+
+        namespace: Dict[str, Callable] = {}
+        exec(  # pylint: disable=exec-used
+            f"def encode({', '.join(f'{name}=0' for name in names)}):\n"
+            f"    return {' | '.join(encoders)}\n",
+            namespace,
+        )
+        return namespace["encode"]
+
+    def decode(self, word: int) -> Dict[str, int]:
+        """ Get the value of every named field in an instruction "word"
+        """
+        return self._decode(word)
+
+    def encode(self, **values: int) -> int:
+        """ Compose an instruction word from the values of named fields; omitted fields are zero
+        """
+        return self._encode(**values)
+
 
 # vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
@@ -1,16 +1,64 @@
 """ An "instruction" is a named, numbered, and instanced operation on a virtual cpu core
 """
 
+from typing import Callable
+
 from pyrisccore.vm.forms.register import RegisterFile
 from pyrisccore.vm.forms.pseudoinstruction import PseudoInstruction
 
 
+class _DecodedField:
+    """ A field of an instruction, decoded from its word on first access
+
+    The value is stored in the instance's __dict__ under the field's name, which then takes
+    precedence over this (non-data) descriptor; later reads are plain attribute lookups.
+    """
+
+    def __init__(self, name: str, get: Callable[[int], int]):
+        self.name = name
+        self.get = get
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.get(instance.word)
+        return value
+
+
 class Instruction:
     """ A named, numbered, and instanced operation on a virtual cpu core
+
+    An instruction is created from its encoded word, e.g. as fetched from memory; or, from the
+    values of its fields with from_fields(), e.g. by an assembler.
+
+    Each field of a subclass's format is an attribute (e.g. ADDI(word).rd), decoded from the word
+    on first access. Only the fields that the instruction actually reads are decoded.
     """
 
     pseudo: PseudoInstruction  # e.g. "ADDI"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        pseudo = getattr(cls, "pseudo", None)
+        if pseudo is None:
+            return
+
+        for name, get in pseudo.operation.format.getters.items():
+            if name not in cls.__dict__:
+                setattr(cls, name, _DecodedField(name, get))
+
+    def __init__(self, word: int):
+
+        # The encoded instruction.
+        self.word: int = word
+
+    @classmethod
+    def from_fields(cls, **values: int) -> "Instruction":
+        """ Create an instruction from the values of its fields (e.g. rd=1, rs1=2, imm=5)
+        """
+        return cls(cls.pseudo.encode(**values))
+
     def execute(self, rf: RegisterFile):
         raise NotImplementedError
 
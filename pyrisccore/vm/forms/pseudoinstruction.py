@@ -2,7 +2,7 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, Union
+from typing import Callable, Dict, Tuple, Union
 
 from pyrisccore.vm.forms.field import Field
 from pyrisccore.vm.forms.format import Format
@@ -19,5 +19,44 @@ class PseudoInstruction:
     constants: Dict[Union[Field, str], int] = field(default_factory=dict)  # e.g. "funct3": 0b000 for "ADDI"
     subfields: Tuple[Format] = tuple()   # e.g. "shamt", derived from imm
 
+    # The bits fixed by the opcode and constants, and their values, in every word of this mnemonic.
+    template: int = field(init=False, repr=False, compare=False)
+    template_mask: int = field(init=False, repr=False, compare=False)
+
+    # Composes a word of this mnemonic from the values of its variable fields; see encode().
+    _encode: Callable[..., int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+
+        fmt = self.operation.format
+        self.template = fmt.encode(opcode=self.operation.opcode)
+        self.template_mask = fmt.values["opcode"].source_mask
+
+        for key, constant in self.constants.items():
+
+            # A Field key holds the value of its source bits, e.g. bits 25-31 for "SRAI".
+            if isinstance(key, Field):
+                self.template = key.source.set(constant, self.template)
+                self.template_mask |= key.source.mask
+
+            else:
+                self.template = fmt.values[key].set(constant, self.template)
+                self.template_mask |= fmt.values[key].source_mask
+
+        self._encode = fmt.compile_encoder(self.template_mask, self.template)
+
+    def matches(self, word: int) -> bool:
+        """ Return whether an instruction word has the opcode and constants of this mnemonic
+        """
+        return word & self.template_mask == self.template
+
+    def encode(self, **operands: int) -> int:
+        """ Compose an instruction word from the values of the variable fields (e.g. rd=1, rs1=2, imm=5)
+
+        Only fields with bits that aren't fixed by the opcode and constants are accepted; omitted
+        fields are zero.
+        """
+        return self._encode(**operands)
+
 
 # vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
@@ -1,7 +1,8 @@
 """ the register file
 """
 
-from typing import Dict, List
+from array import array
+from typing import Dict
 
 
 class RegisterFile:
@@ -13,47 +14,60 @@ class RegisterFile:
 
     Some "XLEN" number of registers sits between x0 and pc.
     These are the "general purpose" registers, by default there are 31.
+
+    Registers are accessed by name (e.g. "x1") with load() and store(), or by their position in
+    the file with load_index() and store_index(). The latter skip the name lookup; it's meant for
+    the decoded register fields of an instruction (rd, rs1, rs2), which are positions already.
     """
 
+    # The first register is the "zero" register; it will always read zero.
+    ZERO_INDEX: int = 0
+
+    # The bits of a value that fit in a register of the file; the rest are dropped by a store.
+    VALUE_MASK: int = (1 << 64) - 1
+
     def __init__(self, xlen: int = 31):
 
         # The number of general purpose registers.
         self.xlen: int = xlen
 
-        # The values of all registers.
-        self.file: List[int] = []
-
-        # The mapping between register names and their position in the file.
-        self.registers: Dict[str, int] = {}
+        # The last register is (defined as via spec) the program counter.
+        self.pc_index: int = xlen + 1
 
-        # The first register is the "zero" register; it will always read zero.
-        # For debugging purposes, it will store whatever is written to it.
-        self.file.append(0)
-        self.registers["x0"] = 0
+        # The values of all registers: x0, the general purpose registers (x1, x2, etc), and pc.
+        # For debugging purposes, x0 will store whatever is written to it.
+        # Values are stored unboxed, as unsigned 64-bit integers.
+        self.file: array = array("Q", [0]) * (xlen + 2)
 
-        # Extend the register file by the general purpose registers (x1, x2, etc)
-        self.file.extend([0] * xlen)
+        # The mapping between register names and their position in the file.
+        self.registers: Dict[str, int] = {"x0": self.ZERO_INDEX}
         self.registers.update({f"x{n}": n for n in range(1, xlen + 1)})
-
-        # The last register is (defined as via spec) the program counter.
-        self.file.extend([0])
-        self.registers["pc"] = len(self.file) - 1
+        self.registers["pc"] = self.pc_index
 
     def load(self, register: str) -> int:
         """ Return the value mapped to a register, by its name (e.g. "x1", "pc")
         """
+        return self.load_index(self.registers[register])
+
+    def store(self, register: str, value: int) -> int:
+        """ Map a value to a register, by its name (e.g. "x1"), returning the previous value
+        """
+        return self.store_index(self.registers[register], value)
+
+    def load_index(self, index: int) -> int:
+        """ Return the value mapped to a register, by its position in the file (e.g. 1 for "x1")
+        """
         # Special case:  x0 is always mapped to zero
-        if register == "x0":
+        if index == 0:
             return 0
 
-        return self.file[self.registers[register]]
+        return self.file[index]
 
-    def store(self, register: str, value: int) -> int:
-        """ Map a value to a register, by its name (e.g. "x1"), returning the previous value
+    def store_index(self, index: int, value: int) -> int:
+        """ Map a value to a register, by its position in the file, returning the previous value
         """
-        pos = self.registers[register]
-        old = self.file[pos]
-        self.file[pos] = value
+        old = self.file[index]
+        self.file[index] = value & self.VALUE_MASK
         return old
 
 
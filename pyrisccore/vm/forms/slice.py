@@ -7,10 +7,7 @@ from pyrisccore import PyrisccoreAssertion
 from pyrisccore.misc import mask
 
 
-@dataclass(
-    frozen=False,       # <- __post_init__() will fail if this is True.
-    unsafe_hash=True    # <- This object is used as though it's actually read-only.
-)
+@dataclass(frozen=False)  # <- __post_init__() will fail if this is True.
 class Slice:
     """ A slice of bits
 
@@ -21,6 +18,8 @@ class Slice:
     >>> Slice(0, 2).get(    0b101) == 0b101
     >>> Slice(1, 2).mask == 0b110
     >>> Slice(1, 2).get(    0b101) == 0b100
+
+    The indices are validated unless Python runs with -O, which also drops assert statements.
     """
 
     start: int  # index of the least-significant bit, aka "lsb"
@@ -29,16 +28,29 @@ class Slice:
     length: int = field(init=False, hash=False, compare=False)
     mask: int = field(init=False, hash=False, compare=False)
 
+    # ~mask, used by set() to clear the slice in the destination.
+    _inverse_mask: int = field(init=False, repr=False, hash=False, compare=False)
+
+    # hash((start, stop)), computed once: this object is used as though it's actually read-only.
+    _hash: int = field(init=False, repr=False, hash=False, compare=False)
+
     def __post_init__(self):
 
-        if self.start < 0 or self.stop < 0:
-            raise PyrisccoreAssertion("'start' and 'stop' cannot be negative")
+        # Validate the indices; both constraints hold for the usual case with a single chained comparison.
+        if __debug__ and not 0 <= self.start <= self.stop:
+
+            if self.start < 0 or self.stop < 0:
+                raise PyrisccoreAssertion("'start' and 'stop' cannot be negative")
 
-        if self.start > self.stop:
             raise PyrisccoreAssertion("'start' is the least-significant index; it must be less-than or equal to 'stop'")
 
         self.length = self.stop - self.start + 1
         self.mask = mask(self.start, self.length)
+        self._inverse_mask = ~self.mask
+        self._hash = hash((self.start, self.stop))
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def get(self, source: int) -> int:
         """ Get the value of the slice of bits in an integer "source"
@@ -49,9 +61,9 @@ class Slice:
         """ Set the slice of bits in an integer "destination" to a value and return it
         """
         return (
-            destination & (~self.mask & mask(0, destination.bit_length()))  # <- zero the 1-bits in the slice of the dest.
-            | value << self.start                                           # <- move the value into the slice of the dest.
-        )
+            destination & self._inverse_mask   # <- zero the 1-bits in the slice of the dest.
+            | value << self.start & self.mask  # <- move the value into the slice of the dest.
+        )                                      #    (and drop any bits that don't fit).
 
 
 # vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
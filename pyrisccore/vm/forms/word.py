@@ -1,6 +1,12 @@
 """ A "word" is an XLEN-sized collection of bits
 """
 
+import sys
+from array import array
+from typing import Sequence, Union
+
+from pyrisccore import PyrisccoreAssertion
+
 
 class Word:
     """ An "XLEN"-sized collection of bits
@@ -14,4 +20,22 @@ class Word:
 WORD = Word(xlen = 32)  # e.g. 32 for "32-bit"
 
 
+def unpack(buffer: Union[bytes, bytearray, memoryview]) -> Sequence[int]:
+    """ Read a buffer of little-endian bytes (e.g. a .text section) as a sequence of 32-bit words
+
+    On a little-endian host the words are a view of the buffer, so nothing is copied and no word
+    is assembled from its bytes in Python; the words are read as they're indexed.
+    """
+    data = memoryview(buffer).cast("B")
+    if data.nbytes % 4:
+        raise PyrisccoreAssertion(f"A buffer of 32-bit words can't be {data.nbytes} bytes long")
+
+    if sys.byteorder == "little":
+        return data.cast("I")
+
+    words = array("I", data.tobytes())
+    words.byteswap()
+    return words
+
+
 # vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
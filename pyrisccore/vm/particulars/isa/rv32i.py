@@ -6,7 +6,9 @@ Opcodes, field names, mnemonics, etc cited from:
  - https://github.com/riscv/riscv-isa-manual/releases/download/Ratified-IMAFDQC/riscv-spec-20191213.pdf
 """
 
-from typing import Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 
 from pyrisccore.vm.forms.field import Field
 from pyrisccore.vm.forms.format import Format
@@ -16,7 +18,7 @@ from pyrisccore.vm.forms.slice import Slice
 
 
 # instruction format letter -> Format
-formats: Dict[str, Format] = {
+formats: Mapping[str, Format] = MappingProxyType({
 
     "R": Format(
         name="R",
@@ -88,11 +90,11 @@ formats: Dict[str, Format] = {
         )
     ),
 
-}
+})
 
 
-# opcode -> Operation
-operations: Dict[int, Operation] = {
+# opname -> Operation
+operations: Mapping[str, Operation] = MappingProxyType({
 
     "OP-IMM":   Operation(formats["I"], 0b0010011, "OP-IMM"),
     "LUI":      Operation(formats["U"], 0b0110111, "LUI"),
@@ -106,11 +108,32 @@ operations: Dict[int, Operation] = {
     "MISC-MEM": Operation(formats["I"], 0b0001111, "MISC-MEM"),
     "SYSTEM":   Operation(formats["I"], 0b1110011, "SYSTEM"),
 
-}
+})
+
+
+# opcode -> Operation, for every 7-bit opcode; None where no operation is defined
+operations_by_opcode: Tuple[Optional[Operation], ...] = tuple(
+    next((op for op in operations.values() if op.opcode == opcode), None)
+    for opcode in range(1 << 7)
+)
+
+
+# The predecessor/successor sets and fence mode of FENCE, shared by the instructions that declare them.
+memory_ordering_fields: Tuple[Field, ...] = (
+    Field(Slice(20, 20), "SW"),
+    Field(Slice(21, 21), "SR"),
+    Field(Slice(22, 22), "SO"),
+    Field(Slice(23, 23), "SI"),
+    Field(Slice(24, 24), "PW"),
+    Field(Slice(25, 25), "PR"),
+    Field(Slice(26, 26), "PO"),
+    Field(Slice(27, 27), "PI"),
+    Field(Slice(28, 31), "fm"),
+)
 
 
 # mnemonic -> PseudoInstruction
-pseudoinstructions: Dict[str, PseudoInstruction] = {
+pseudoinstructions: Mapping[str, PseudoInstruction] = MappingProxyType({
 
     # Register-Immediate
 
@@ -136,12 +159,12 @@ pseudoinstructions: Dict[str, PseudoInstruction] = {
     ),
     "ORI": PseudoInstruction("ORI", operations["OP-IMM"],
         constants={
-            "funct3": 0b000,
+            "funct3": 0b110,
         },
     ),
     "XORI": PseudoInstruction("XORI", operations["OP-IMM"],
         constants={
-            "funct3": 0b000,
+            "funct3": 0b100,
         },
     ),
     "SLLI": PseudoInstruction("SLLI", operations["OP-IMM"],
@@ -333,17 +356,7 @@ pseudoinstructions: Dict[str, PseudoInstruction] = {
             "rd": 0,
             "rs1": 0,
         },
-        subfields=(
-            Field(Slice(20, 20), "SW"),
-            Field(Slice(21, 21), "SR"),
-            Field(Slice(22, 22), "SO"),
-            Field(Slice(23, 23), "SI"),
-            Field(Slice(24, 24), "PW"),
-            Field(Slice(25, 25), "PR"),
-            Field(Slice(26, 26), "PO"),
-            Field(Slice(27, 27), "PI"),
-            Field(Slice(28, 31), "fm"),
-        ),
+        subfields=memory_ordering_fields,
     ),
 
     # Environment Call and Breakpoints
@@ -355,48 +368,82 @@ pseudoinstructions: Dict[str, PseudoInstruction] = {
             "funct3": 0b000,  # PRIV
             "imm": 0b000,
         },
-        subfields=(
-            Field(Slice(20, 20), "SW"),
-            Field(Slice(21, 21), "SR"),
-            Field(Slice(22, 22), "SO"),
-            Field(Slice(23, 23), "SI"),
-            Field(Slice(24, 24), "PW"),
-            Field(Slice(25, 25), "PR"),
-            Field(Slice(26, 26), "PO"),
-            Field(Slice(27, 27), "PI"),
-            Field(Slice(28, 31), "fm"),
-        ),
+        subfields=memory_ordering_fields,
     ),
     "EBREAK": PseudoInstruction("EBREAK", operations["SYSTEM"],
         constants={
             "rd": 0,
             "rs1": 0,
             "funct3": 0b000,  # PRIV
-            "imm": 0b000,
+            "imm": 0b001,
         },
-        subfields=(
-            Field(Slice(20, 20), "SW"),
-            Field(Slice(21, 21), "SR"),
-            Field(Slice(22, 22), "SO"),
-            Field(Slice(23, 23), "SI"),
-            Field(Slice(24, 24), "PW"),
-            Field(Slice(25, 25), "PR"),
-            Field(Slice(26, 26), "PO"),
-            Field(Slice(27, 27), "PI"),
-            Field(Slice(28, 31), "fm"),
-        ),
+        subfields=memory_ordering_fields,
     ),
 
 
-}
+})
 
 
-aliases: Dict[str, PseudoInstruction] = {
+aliases: Mapping[str, PseudoInstruction] = MappingProxyType({
     "NOP": PseudoInstruction("ADDI", operations["OP-IMM"], {
         "funct3": 0b000,
         "imm": 0,
     }),
-}
+})
+
+
+def decode_key(word: int) -> int:
+    """ Pack the bits that tell RV32I instructions apart into an 11-bit table index
+
+    The layout of the index is (bit 30 << 10) | (funct3 << 7) | opcode. Bit 30 is the only bit of
+    funct7 that RV32I uses to tell mnemonics apart (e.g. ADD/SUB, SRLI/SRAI); the rest of funct7 is
+    checked by PseudoInstruction.matches().
+    """
+    return (word & 0x7f) | ((word >> 5) & 0x380) | ((word >> 20) & 0x400)
+
+
+def _pseudoinstructions_by_key() -> Tuple[Tuple[PseudoInstruction, ...], ...]:
+    """ Place each pseudo-instruction at every decode key that its opcode and constants allow
+    """
+    table: List[Tuple[PseudoInstruction, ...]] = [()] * (1 << 11)
+    for pi in pseudoinstructions.values():
+
+        # The bits of the key that aren't fixed by the pseudo-instruction can take any value.
+        fixed = decode_key(pi.template)
+        free = ~decode_key(pi.template_mask) & 0x7ff
+
+        # Visit every subset of the free bits, from all of them down to none.
+        subset = free
+        while True:
+            table[fixed | subset] += (pi,)
+            if subset == 0:
+                break
+            subset = (subset - 1) & free
+
+    return tuple(table)
+
+
+# decode key -> candidate PseudoInstructions, e.g. ECALL and EBREAK share a key
+pseudoinstructions_by_key: Tuple[Tuple[PseudoInstruction, ...], ...] = _pseudoinstructions_by_key()
+
+
+def decode(word: int) -> Optional[PseudoInstruction]:
+    """ Return the pseudo-instruction of an instruction word, or None if it isn't an RV32I instruction
+    """
+    for pi in pseudoinstructions_by_key[decode_key(word)]:
+        if pi.matches(word):
+            return pi
+    return None
+
+
+@lru_cache(maxsize=4096)
+def decode_cached(word: int) -> Optional[PseudoInstruction]:
+    """ Like decode(), but remembers the 4096 most recently decoded words
+
+    Programs execute the same instruction words over and over (e.g. in loops), and a word always
+    decodes to the same pseudo-instruction, so the result is looked up by the word alone.
+    """
+    return decode(word)
 
 
 # vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
@@ -6,10 +6,11 @@ from typing import List
 import pytest
 
 from pyrisccore import PyrisccoreAssertion
-from pyrisccore.vm.forms.field import bit_count, Field, Value
+from pyrisccore.vm.forms.field import Field, Value
 from pyrisccore.vm.forms.slice import Slice
 
 
+@pytest.mark.skipif(not __debug__, reason="constraints are not checked under python -O")
 def test_field_invalid_inputs():
 
     # Case: source/destination are not the same size
@@ -24,6 +25,7 @@ def test_value_tuple_cast():
     assert isinstance(v.fields, tuple)
 
 
+@pytest.mark.skipif(not __debug__, reason="constraints are not checked under python -O")
 def test_value_invalid_inputs():
 
     # Case: Overlapping source bits
@@ -40,6 +42,20 @@ def test_value_invalid_inputs():
             Field(source=Slice(2, 2), destination=Slice(0, 0)),
         ])
 
+    # Case: Partially overlapping source bits
+    with pytest.raises(PyrisccoreAssertion):
+        Value(fields=[
+            Field(source=Slice(0, 1), destination=Slice(0, 1)),
+            Field(source=Slice(1, 2), destination=Slice(2, 3)),
+        ])
+
+    # Case: Partially overlapping destination bits
+    with pytest.raises(PyrisccoreAssertion):
+        Value(fields=[
+            Field(source=Slice(0, 1), destination=Slice(0, 1)),
+            Field(source=Slice(2, 3), destination=Slice(1, 2)),
+        ])
+
 
 @pytest.mark.parametrize(
     ["field", "word", "output"],
@@ -82,6 +98,11 @@ def test_field_read_without_destination(field: Field, word: int, output: int):
         [Field(source=Slice(1, 1)), [0b0, 0b111], 0b101],
         [Field(source=Slice(1, 1)), [0b0, 0b100], 0b100],
 
+        # Case: Bits of the value that don't fit in the field don't overwrite the destination
+        [Field(source=Slice(1, 2)), [0b1111, 0b10001], 0b10111],
+        [Field(source=Slice(1, 2)), [0b1000, 0b10001], 0b10001],
+        [Field(source=Slice(1, 2)), [-1, 0b0], 0b110],
+
     ]
 )
 def test_field_write_without_destination(field: Field, args: List[int], output: int):
@@ -218,6 +239,26 @@ def test_value_write(value: Value, output: int, word: int):
     assert value.set(word, 0) == output
 
 
+def test_value_write_overwrites_destination():
+
+    value = Value(fields=(
+        Field(source=Slice(0, 0), destination=Slice(0, 0)),
+        Field(source=Slice(2, 2), destination=Slice(1, 1)),
+    ))
+
+    # Case: Bits of the value that are set in the destination are cleared
+    assert value.set(0b00, 0b101) == 0b000
+    assert value.set(0b10, 0b101) == 0b100
+
+    # Case: Bits outside of the value are preserved
+    assert value.set(0b00, 0b1111) == 0b1010
+
+    # Case: Bits of the value that don't fit in its fields don't overwrite the destination
+    value = Value(fields=(Field(source=Slice(1, 2)),))
+    assert value.set(0b1111, 0b10001) == 0b10111
+    assert value.set(-1, 0) == 0b110
+
+
 @pytest.mark.parametrize(
     ["value", "src_mask", "dst_mask"],
     [
@@ -0,0 +1,97 @@
+""" Test pyrisccore.vm.forms.format
+"""
+
+from typing import Dict
+
+import pytest
+
+from pyrisccore import PyrisccoreAssertion
+from pyrisccore.vm.forms.field import Field
+from pyrisccore.vm.forms.format import Format
+from pyrisccore.vm.forms.slice import Slice
+from pyrisccore.vm.particulars.isa.rv32i import formats
+
+
+def test_invalid_inputs():
+
+    # Case: Fields must be named, by a valid identifier
+    with pytest.raises(PyrisccoreAssertion):
+        Format("X", (Field(Slice(0, 6)),))
+    with pytest.raises(PyrisccoreAssertion):
+        Format("X", (Field(Slice(0, 6), "not-an-identifier"),))
+
+
+def test_values():
+
+    # Case: One Value per field name
+    assert set(formats["R"].values) == {"opcode", "rd", "funct3", "rs1", "rs2", "funct7"}
+
+    # Case: Fields with the same name compose one Value
+    assert len(formats["J"].values["imm"].fields) == 4
+
+
+# Words and the values of their fields, in each format
+words = [
+    # Case: addi x1, x2, 5
+    [formats["I"], 0x00510093, {"opcode": 0b0010011, "rd": 1, "funct3": 0, "rs1": 2, "imm": 5}],
+
+    # Case: sub x3, x4, x5
+    [formats["R"], 0x405201b3, {"opcode": 0b0110011, "rd": 3, "funct3": 0, "rs1": 4, "rs2": 5, "funct7": 0b0100000}],
+
+    # Case: sw x6, 0x7ff(x7)
+    [formats["S"], 0x7e63afa3, {"opcode": 0b0100011, "funct3": 0b010, "rs1": 7, "rs2": 6, "imm": 0x7ff}],
+
+    # Case: beq x1, x2, 0x800 (the immediate's bit 11 is stored in bit 7 of the word)
+    [formats["B"], 0x00208063 | (1 << 7), {"opcode": 0b1100011, "funct3": 0, "rs1": 1, "rs2": 2, "imm": 0x800}],
+
+    # Case: lui x1, 0x12345000
+    [formats["U"], 0x123450b7, {"opcode": 0b0110111, "rd": 1, "imm": 0x12345000}],
+
+    # Case: jal x1, 0x800 (the immediate's bit 11 is stored in bit 20 of the word)
+    [formats["J"], 0x001000ef, {"opcode": 0b1101111, "rd": 1, "imm": 0x800}],
+
+]
+
+
+@pytest.mark.parametrize(["fmt", "word", "values"], words)
+def test_decode(fmt: Format, word: int, values: Dict[str, int]):
+    assert fmt.decode(word) == values
+
+
+@pytest.mark.parametrize(["fmt", "word", "values"], words)
+def test_encode(fmt: Format, word: int, values: Dict[str, int]):
+    assert fmt.encode(**values) == word
+
+
+@pytest.mark.parametrize(["fmt", "word", "values"], words)
+def test_getters(fmt: Format, word: int, values: Dict[str, int]):
+
+    # Case: One getter per field name, each decoding the same value as decode()
+    assert {name: get(word) for name, get in fmt.getters.items()} == values
+
+
+def test_encode_masks_values():
+
+    # Case: Omitted fields are zero
+    assert formats["I"].encode() == 0
+
+    # Case: Bits of a value outside of its field are dropped, e.g. a negative immediate
+    assert formats["I"].encode(imm=-1) == 0xfff00000
+    assert formats["I"].encode(rd=0b100001) == 0b00001 << 7
+
+
+def test_compile_encoder():
+
+    # Case: Fixed bits are always set, and fields entirely within them aren't arguments
+    encode = formats["I"].compile_encoder(fixed_mask=0x7f, fixed_bits=0b0010011)
+    assert encode() == 0b0010011
+    assert encode(rd=1, rs1=2, imm=5) == 0x00510093
+    with pytest.raises(TypeError):
+        encode(opcode=0)
+
+    # Case: Fixed bits within a field can't be overwritten by its value
+    encode = formats["I"].compile_encoder(fixed_mask=0xfe000000, fixed_bits=0x40000000)
+    assert encode(imm=0xfff) == 0x41f00000
+
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
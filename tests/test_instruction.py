@@ -0,0 +1,44 @@
+""" Test pyrisccore.vm.forms.instruction
+"""
+
+from pyrisccore.vm.forms.instruction import Instruction
+from pyrisccore.vm.particulars.isa.rv32i import pseudoinstructions
+
+
+class ADDI(Instruction):
+    pseudo = pseudoinstructions["ADDI"]
+
+
+class SRAI(Instruction):
+    pseudo = pseudoinstructions["SRAI"]
+
+
+def test_init():
+
+    # Case: The word is kept as given
+    assert ADDI(0x00510093).word == 0x00510093
+
+
+def test_fields():
+
+    # Case: addi x1, x2, 5
+    addi = ADDI(0x00510093)
+    assert (addi.opcode, addi.rd, addi.funct3, addi.rs1, addi.imm) == (0b0010011, 1, 0, 2, 5)
+
+    # Case: Fields are decoded on first access, and then cached on the instance
+    addi = ADDI(0x00510093)
+    assert "rd" not in vars(addi)
+    assert addi.rd == 1
+    assert vars(addi)["rd"] == 1
+
+
+def test_from_fields():
+
+    # Case: addi x1, x2, 5
+    assert ADDI.from_fields(rd=1, rs1=2, imm=5).word == 0x00510093
+
+    # Case: srai x1, x2, 3 (a Field constant sets the upper bits of the immediate)
+    assert SRAI.from_fields(rd=1, rs1=2, imm=3).word == 0x40315093
+
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
@@ -23,13 +23,38 @@ from pyrisccore.misc import (
 def test_frozendict(d: dict):
     f = frozendict(d)
 
-    # Confirm it's hashable
-    hash(f)
+    # Confirm it's hashable, and that the cached hash is stable
+    assert hash(f) == hash(f) == hash(frozendict(d))
 
     # Confirm keys are preserved
     assert d.keys() == f.keys()
 
 
+@pytest.mark.parametrize(
+    ["mutate"],
+    [
+        [lambda f: f.__setitem__('a', 2)],
+        [lambda f: f.__delitem__('a')],
+        [lambda f: f.__ior__({'b': 2})],
+        [lambda f: f.clear()],
+        [lambda f: f.pop('a')],
+        [lambda f: f.popitem()],
+        [lambda f: f.setdefault('b', 2)],
+        [lambda f: f.update({'b': 2})],
+    ]
+)
+def test_frozendict_is_immutable(mutate):
+    f = frozendict({'a': 1})
+    h = hash(f)
+
+    with pytest.raises(NotImplementedError):
+        mutate(f)
+
+    # Confirm the contents, and so the hash, are unchanged
+    assert f == {'a': 1}
+    assert hash(f) == h == hash(frozendict({'a': 1}))
+
+
 @pytest.mark.parametrize(
     ["i", "count"],
     [
@@ -84,4 +84,28 @@ def test_load_and_store():
     assert rf.load("pc") == 0x3
 
 
+def test_load_and_store_by_index():
+    """ RegisterFile.load_index() + RegisterFile.store_index() tests
+    """
+    rf = RegisterFile(xlen=2)
+
+    # Case: Positions in the file match the register names
+    assert rf.ZERO_INDEX == rf.registers["x0"]
+    assert rf.pc_index == rf.registers["pc"]
+
+    # Case: x0 reads zero, even after a non-zero store
+    assert rf.store_index(rf.ZERO_INDEX, 0x2) == 0x0
+    assert rf.load_index(rf.ZERO_INDEX) == 0x0
+
+    # Case: Storing by index is visible when loading by name, and vice versa
+    assert rf.store_index(1, 0x2) == 0x0
+    assert rf.load("x1") == 0x2
+    rf.store("pc", 0x3)
+    assert rf.load_index(rf.pc_index) == 0x3
+
+    # Case: Values are truncated to the width of a register, e.g. a negative value
+    rf.store_index(2, -1)
+    assert rf.load_index(2) == rf.VALUE_MASK
+
+
 # vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
@@ -0,0 +1,163 @@
+""" Test pyrisccore.vm.particulars.isa.rv32i
+"""
+
+from typing import Optional
+
+import pytest
+
+from pyrisccore.vm.particulars.isa.rv32i import (
+    aliases,
+    decode,
+    decode_cached,
+    decode_key,
+    formats,
+    memory_ordering_fields,
+    operations,
+    operations_by_opcode,
+    pseudoinstructions,
+    pseudoinstructions_by_key,
+)
+
+
+def test_tables_are_read_only():
+
+    # Case: The ISA tables can't be changed after import
+    for table in (formats, operations, pseudoinstructions, aliases):
+        with pytest.raises(TypeError):
+            table["X"] = None
+
+
+def test_operations_by_opcode():
+
+    # Case: Every 7-bit opcode has a slot
+    assert len(operations_by_opcode) == 1 << 7
+
+    # Case: Every operation is found by its opcode
+    for op in operations.values():
+        assert operations_by_opcode[op.opcode] is op
+
+    # Case: Undefined opcodes have no operation
+    assert operations_by_opcode[0b1111111] is None
+    assert sum(op is not None for op in operations_by_opcode) == len(operations)
+
+
+@pytest.mark.parametrize(
+    ["mnemonic", "template", "template_mask"],
+    [
+        # Case: opcode only
+        ["LUI", 0b0110111, 0x7f],
+
+        # Case: opcode and funct3
+        ["ADDI", 0b0010011, 0x707f],
+
+        # Case: opcode, funct3, and funct7
+        ["SUB", 0x40000033, 0xfe00707f],
+
+        # Case: opcode, funct3, and a Field constant of the upper immediate bits
+        ["SRAI", 0x40005013, 0xfe00707f],
+
+    ]
+)
+def test_pseudoinstruction_template(mnemonic: str, template: int, template_mask: int):
+    pi = pseudoinstructions[mnemonic]
+    assert pi.template == template
+    assert pi.template_mask == template_mask
+
+
+@pytest.mark.parametrize(
+    ["pi", "word"],
+    [
+        [pseudoinstructions["ECALL"], 0x00000073],
+        [pseudoinstructions["EBREAK"], 0x00100073],
+        [aliases["NOP"], 0x00000013],
+    ]
+)
+def test_constant_encodings(pi, word: int):
+    """ Instructions without operands (in common use) are encoded entirely by their template
+    """
+    assert pi.template == word
+    assert pi.encode() == word
+
+
+def test_pseudoinstruction_encode():
+
+    # Case: add x1, x2, x3
+    assert pseudoinstructions["ADD"].encode(rd=1, rs1=2, rs2=3) == 0x003100b3
+
+    # Case: Constant bits can't be overwritten by an operand
+    assert pseudoinstructions["SRAI"].encode(rd=1, rs1=2, imm=3) == 0x40315093
+    assert pseudoinstructions["SRAI"].encode(rd=1, rs1=2, imm=0xfff) == 0x41f15093
+
+    # Case: Fields that are entirely constant aren't operands
+    assert pseudoinstructions["ECALL"].encode() == pseudoinstructions["ECALL"].template
+    with pytest.raises(TypeError):
+        pseudoinstructions["ADDI"].encode(funct3=0b111)
+
+
+def test_shared_subfields():
+
+    # Case: The same tuple of Field objects is shared, not rebuilt for each instruction
+    for mnemonic in ("FENCE", "ECALL", "EBREAK"):
+        assert pseudoinstructions[mnemonic].subfields is memory_ordering_fields
+
+
+def test_decode_templates():
+
+    # Case: Every mnemonic's fixed bits decode back to it, i.e. no two mnemonics share their constants
+    for mnemonic, pi in pseudoinstructions.items():
+        assert decode(pi.template) is pi, mnemonic
+
+
+def test_decode_key():
+
+    # Case: Each of opcode, funct3, and bit 30 lands in its own bits of the key
+    assert decode_key(0x0000007f) == 0x7f
+    assert decode_key(0x00007000) == 0x7 << 7
+    assert decode_key(0x40000000) == 0x1 << 10
+
+    # Case: Other bits are ignored, including the rest of funct7
+    assert decode_key(0xbfff8f80) == 0
+    assert len(pseudoinstructions_by_key) == 1 << 11
+
+
+@pytest.mark.parametrize(
+    ["word", "mnemonic"],
+    [
+        [0x00510093, "ADDI"],   # addi x1, x2, 5
+        [0x003100b3, "ADD"],    # add x1, x2, x3
+        [0x405201b3, "SUB"],    # sub x3, x4, x5
+        [0x00315093, "SRLI"],   # srli x1, x2, 3
+        [0x40315093, "SRAI"],   # srai x1, x2, 3
+        [0x123450b7, "LUI"],    # lui x1, 0x12345000
+        [0x001000ef, "JAL"],    # jal x1, 0x800
+        [0x7e63afa3, "SW"],     # sw x6, 0x7ff(x7)
+        [0x00000073, "ECALL"],
+        [0x00100073, "EBREAK"],
+
+        # Case: Not an RV32I instruction
+        [0x00000000, None],
+        [0xffffffff, None],
+
+        # Case: A funct7 that no shift-immediate uses
+        [0x20315093, None],
+
+    ]
+)
+def test_decode(word: int, mnemonic: Optional[str]):
+    pi = decode(word)
+    assert (pi and pi.mnemonic) == mnemonic
+
+
+def test_decode_cached():
+
+    # Case: A cached decode is the same as an uncached one, including words that aren't RV32I
+    for word in [0x00510093, 0x40315093, 0x00000000]:
+        assert decode_cached(word) is decode(word)
+
+    # Case: Decoding a word again is a cache hit
+    hits = decode_cached.cache_info().hits
+    assert decode_cached(0x00510093).mnemonic == "ADDI"
+    assert decode_cached.cache_info().hits == hits + 1
+
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file
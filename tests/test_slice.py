@@ -7,6 +7,7 @@ from pyrisccore import PyrisccoreAssertion
 from pyrisccore.vm.forms.slice import Slice
 
 
+@pytest.mark.skipif(not __debug__, reason="indices are not validated under python -O")
 def test_input_validation():
 
     # Case: start and stop cannot be negative
@@ -27,6 +28,7 @@ def test_hash_and_compare():
     assert hash(Slice(0, 0)) == hash(Slice(0, 0))
     assert hash(Slice(0, 0)) != hash(Slice(0, 1))
     assert hash(Slice(0, 0)) != hash(Slice(1, 1))
+    assert {Slice(0, 1): "x"}[Slice(0, 1)] == "x"
 
     # Comparison
     assert Slice(0, 0) == Slice(0, 0)
@@ -75,6 +77,10 @@ def test_get(s: Slice, source: int, output: int):
         [Slice(1, 1), 0b0, 0b111, 0b101],
         [Slice(1, 1), 0b0, 0b100, 0b100],
 
+        # Case: Bits of the value that don't fit in the slice don't overwrite the destination
+        [Slice(1, 2), 0b1111, 0b10001, 0b10111],
+        [Slice(1, 2), 0b1000, 0b10001, 0b10001],
+
     ]
 )
 def test_set(s: Slice, value: int, destination: int, output: int):
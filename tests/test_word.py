@@ -0,0 +1,30 @@
+""" Test pyrisccore.vm.forms.word
+"""
+
+import pytest
+
+from pyrisccore import PyrisccoreAssertion
+from pyrisccore.vm.forms.word import unpack
+
+
+def test_unpack():
+
+    # Case: addi x1, x2, 5; ecall
+    assert list(unpack(bytes.fromhex("93005100" "73000000"))) == [0x00510093, 0x00000073]
+
+    # Case: Empty buffer
+    assert list(unpack(b"")) == []
+
+    # Case: Other bytes-like objects
+    assert list(unpack(bytearray(b"\xff\xff\xff\xff"))) == [0xffffffff]
+    assert list(unpack(memoryview(b"\x01\x00\x00\x00"))) == [1]
+
+
+def test_unpack_invalid_inputs():
+
+    # Case: The buffer must hold whole words
+    with pytest.raises(PyrisccoreAssertion):
+        unpack(b"\x00\x00\x00")
+
+
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
\ No newline at end of file